@@ -15,56 +15,78 @@
 # https://www.gnu.org/licenses/gpl-3.0.html.
 # -----------------------------------------------------------------------------
 
+import os
 import numpy as np
+from numpy.polynomial import polynomial as P
 import matplotlib.pyplot as plt
 import math
 from tabulate import tabulate
 
+HEADLESS = bool(os.environ.get('HEADLESS'))
+if HEADLESS:
+    plt.switch_backend('Agg')
+
 # Step 1: Define the data points for interpolation
 # x_data: Known x-values (e.g., points where we know the function values)
 # y_data: Known y-values (e.g., sin(x) at those x-values)
 x_data = np.array([0.0, 0.5, 1.0, 1.5, 2.0])  # 5 points for interpolation
 y_data = np.array([math.sin(x) for x in x_data])  # y = sin(x) at these points
 
-# Step 2: Define the Lagrange interpolation function
-def lagrange_interpolation(x, x_data, y_data):
-    # Initialize the result
-    result = 0.0
+# Step 2: Define the barycentric weights
+# w_i = 1 / product of (x_i - x_j) for j != i, computed once for the data set
+def barycentric_weights(x_data):
     n = len(x_data)  # Number of data points
-    # Loop over each data point
-    for i in range(n):
-        # Compute the Lagrange basis polynomial L_i(x)
-        term = y_data[i]  # Start with y_i
-        for j in range(n):
-            if j != i:
-                # L_i(x) = product of (x - x_j)/(x_i - x_j) for j != i
-                term *= (x - x_data[j]) / (x_data[i] - x_data[j])
-        result += term
-    return result
+    # Adding the identity turns the zero diagonal (x_i - x_i) into 1
+    return 1.0 / np.prod(x_data[:, None] - x_data[None, :] + np.eye(n), axis=1)
+
+# Step 3: Expand the Lagrange interpolant into monomial coefficients
+# p(x) = sum of w_i * y_i * product of (x - x_j) for j != i
+# c: Coefficients c[0..n-1] of p(x) = c[0] + c[1]*x + ... + c[n-1]*x^(n-1)
+def lagrange_coefficients(x_data, y_data, w):
+    c = np.zeros(len(x_data))
+    for i in range(len(x_data)):
+        # polyfromroots gives the coefficients of product of (x - x_j), j != i
+        c += w[i] * y_data[i] * P.polyfromroots(np.delete(x_data, i))
+    return c
+
+# Step 4: Define Estrin's scheme for a degree-4 polynomial
+# p(x) = (c0 + c1*x) + x^2*(c2 + c3*x) + x^4*c4
+# The bracketed terms are independent, unlike Horner's chain of multiply-adds
+def estrin4(x, c):
+    x2 = x * x
+    x4 = x2 * x2
+    return (c[0] + c[1] * x) + x2 * (c[2] + c[3] * x) + x4 * c[4]
 
-# Step 3: Create points for plotting the interpolated function
+# Step 5: Create points for plotting the interpolated function
+# w: Barycentric weights for the data points
+# c: Monomial coefficients of the interpolating polynomial (built once)
 # x_plot: Fine grid of x-values for smooth plotting
-# y_plot: Interpolated y-values
+# y_plot: Interpolated y-values (Estrin for 5 points, Horner via polyval otherwise)
+w = barycentric_weights(x_data)
+c = lagrange_coefficients(x_data, y_data, w)
 x_plot = np.linspace(0, 2, 100)  # 100 points from 0 to 2
-y_plot = np.array([lagrange_interpolation(x, x_data, y_data) for x in x_plot])
+if len(c) == 5:
+    y_plot = estrin4(x_plot, c)
+else:
+    y_plot = P.polyval(x_plot, c)
 
-# Step 4: Compute the true function for comparison
+# Step 6: Compute the true function for comparison
 # y_true: True values of sin(x) at x_plot points
 y_true = np.sin(x_plot)
 
-# Step 5: Print table for a subset of x_plot
-table_data = []
-for i in range(0, len(x_plot), 10):
-    x_val = x_plot[i]
-    interp_val = y_plot[i]
-    true_val = y_true[i]
-    error = abs(interp_val - true_val)
-    table_data.append([round(x_val, 3), round(interp_val, 6), round(true_val, 6), round(error, 6)])
+# Step 7: Print table for a subset of x_plot
+# Every 10th point is taken, and each column is rounded in one NumPy call
+x_val = x_plot[::10]
+interp_val = y_plot[::10]
+true_val = y_true[::10]
+error = np.abs(interp_val - true_val)
+table_data = np.column_stack([np.round(x_val, 3), np.round(interp_val, 6),
+                              np.round(true_val, 6), np.round(error, 6)]).tolist()
 
 headers = ["x", "Interpolated y", "True sin(x)", "Absolute Error"]
 print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
 
-# Step 6: Plot the results
+# Step 8: Plot the results
 plt.figure(figsize=(10, 6))
 plt.plot(x_plot, y_plot, 'b-', label='Lagrange Interpolation')
 plt.plot(x_plot, y_true, 'r--', label='True Function (sin(x))')
@@ -75,4 +97,6 @@ plt.ylabel('y')
 plt.legend()
 plt.grid(True)
 plt.savefig('lagrange_interpolation.png')
-plt.show()
\ No newline at end of file
+if not HEADLESS:
+    plt.show()
+plt.close('all')
\ No newline at end of file
@@ -15,10 +15,16 @@
 # https://www.gnu.org/licenses/gpl-3.0.html.
 # -----------------------------------------------------------------------------
 
+import os
+import struct
 import numpy as np
 import matplotlib.pyplot as plt
 from tabulate import tabulate
 
+HEADLESS = bool(os.environ.get('HEADLESS'))
+if HEADLESS:
+    plt.switch_backend('Agg')
+
 # Step 1: Define the function whose root we want to find
 # f(x) = x^3 - x - 2
 def f(x):
@@ -26,8 +32,8 @@ def f(x):
 
 # Step 2: Define problem parameters
 # a, b: Initial interval [a, b] where f(a) * f(b) < 0 (root exists)
-# tol: Tolerance for convergence
-# max_iter: Maximum number of iterations
+# tol: Tolerance on |f(x)| for convergence
+# max_iter: Maximum number of iterations (bit-pattern bisection needs about 64 at most)
 a = 1.0
 b = 2.0
 tol = 1e-6
@@ -39,36 +45,66 @@ if f(a) * f(b) >= 0:
     print("Error: f(a) and f(b) must have opposite signs!")
     exit()
 
-# Step 4: Initialize lists to store iteration history for plotting
-x_values = []  # Store x approximations
-f_values = []  # Store f(x) values
-
-# Step 5: Bisection method loop
-for i in range(max_iter):
-    # Compute the midpoint of the interval
-    x_n = (a + b) / 2
-    x_values.append(x_n)
-    f_values.append(f(x_n))
-
-    # Check if the solution is close enough
-    if abs(f(x_n)) < tol or (b - a) / 2 < tol:
-        print(f"Root found at x = {x_n:.6f} after {i+1} iterations")
-        break
-
-    # Update the interval [a, b] based on the sign of f(x_n)
-    if f(x_n) * f(a) < 0:
-        b = x_n  # Root is in [a, x_n]
+# Step 4: Define the mapping between floats and ordered integer keys
+# The IEEE-754 bits of a double, read as a signed 64-bit integer, sort in the
+# same order as the floats once negative values are mirrored around zero.
+# Halving the key range halves the number of representable doubles in [a, b],
+# so any bracket shrinks to adjacent doubles (1 ULP) within about 64 steps.
+def float_to_key(x):
+    bits = struct.unpack('<q', struct.pack('<d', x))[0]
+    return bits if bits >= 0 else -(bits & 0x7FFFFFFFFFFFFFFF)
+
+def key_to_float(k):
+    if k >= 0:
+        return struct.unpack('<d', struct.pack('<q', k))[0]
+    return -struct.unpack('<d', struct.pack('<q', -k))[0]
+
+# Step 5: Define the bisection solver
+# Returns the iteration history (x_n and f(x_n)) for plotting
+def bisection(a, b, tol, max_iter):
+    # Preallocate arrays to store iteration history for plotting
+    x_values = np.empty(max_iter)  # Store x approximations
+    f_values = np.empty(max_iter)  # Store f(x) values
+    k = 0  # Number of stored iterations
+
+    # Bisection method loop, carried out on the integer keys of a and b
+    a_key = float_to_key(a)
+    b_key = float_to_key(b)
+    fa = f(a)  # f at the left end, updated together with a
+    for i in range(max_iter):
+        # Compute the midpoint of the interval in key space
+        # (within one ULP of (a + b) / 2 while a and b lie in the same binade)
+        mid_key = (a_key + b_key) // 2
+        x_n = key_to_float(mid_key)
+        fx_n = f(x_n)  # Evaluate f once per iteration and reuse it below
+        x_values[k] = x_n
+        f_values[k] = fx_n
+        k += 1
+
+        # Check if the solution is close enough or [a, b] is down to 1 ULP
+        if abs(fx_n) < tol or b_key - a_key <= 1:
+            print(f"Root found at x = {x_n:.6f} after {i+1} iterations")
+            break
+
+        # Update the interval [a, b] based on the sign of f(x_n)
+        if fx_n * fa < 0:
+            b, b_key = x_n, mid_key  # Root is in [a, x_n]
+        else:
+            a, a_key, fa = x_n, mid_key, fx_n  # Root is in [x_n, b]
+
     else:
-        a = x_n  # Root is in [x_n, b]
+        print(f"Did not converge within {max_iter} iterations")
+
+    return x_values[:k], f_values[:k]
 
-else:
-    print(f"Did not converge within {max_iter} iterations")
+# Step 6: Run the bisection method
+x_values, f_values = bisection(a, b, tol, max_iter)
 
-# Step 6: Create points for plotting the function
+# Step 7: Create points for plotting the function
 x_plot = np.linspace(0.5, 2.5, 100)  # Range around the root
 y_plot = f(x_plot)
 
-# Step 7: Plot the function and iterations
+# Step 8: Plot the function and iterations
 plt.figure(figsize=(10, 6))
 plt.plot(x_plot, y_plot, 'b-', label='f(x) = x^3 - x - 2')
 plt.axhline(0, color='black', linestyle='--', linewidth=0.5)  # x-axis
@@ -80,19 +116,22 @@ plt.ylabel('f(x)')
 plt.legend()
 plt.grid(True)
 plt.savefig('bisection_method.png')
-plt.show()
+if not HEADLESS:
+    plt.show()
+plt.close('all')
 
-# Step 8: Print iteration table
+# Step 9: Print iteration table
 table_data = []
 a_temp = 1.0
 b_temp = 2.0
+fa_temp = f(a_temp)
 for i, (x_n, fx) in enumerate(zip(x_values, f_values)):
     interval_width = (b_temp - a_temp) / 2
     table_data.append([i + 1, round(x_n, 8), round(fx, 8), round(interval_width, 8)])
     # Mimic interval update to reflect what actually happened
-    if f(x_n) * f(a_temp) < 0:
+    if fx * fa_temp < 0:
         b_temp = x_n
     else:
-        a_temp = x_n
+        a_temp, fa_temp = x_n, fx
 headers = ["Iteration", "x_n", "f(x_n)", "(b - a)/2"]
 print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
\ No newline at end of file
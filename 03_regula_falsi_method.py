@@ -15,10 +15,15 @@
 # https://www.gnu.org/licenses/gpl-3.0.html.
 # -----------------------------------------------------------------------------
 
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 from tabulate import tabulate
 
+HEADLESS = bool(os.environ.get('HEADLESS'))
+if HEADLESS:
+    plt.switch_backend('Agg')
+
 # Step 1: Define the function whose root we want to find
 # f(x) = x^3 - x - 2
 def f(x):
@@ -39,31 +44,41 @@ if f(a) * f(b) >= 0:
     print("Error: f(a) and f(b) must have opposite signs!")
     exit()
 
-# Step 4: Initialize lists to store iteration history for plotting
-x_values = []  # Store x approximations
-f_values = []  # Store f(x) values
+# Step 4: Preallocate arrays to store iteration history for plotting
+x_values = np.empty(max_iter)  # Store x approximations
+f_values = np.empty(max_iter)  # Store f(x) values
+k = 0  # Number of stored iterations
 
 # Step 5: Regula Falsi method loop
+# fa, fb: f at the interval ends, updated together with a and b
+fa = f(a)
+fb = f(b)
 for i in range(max_iter):
     # Compute the new approximation x_n using the Regula Falsi formula
-    x_n = (a * f(b) - b * f(a)) / (f(b) - f(a))
-    x_values.append(x_n)
-    f_values.append(f(x_n))
+    x_n = (a * fb - b * fa) / (fb - fa)
+    fx_n = f(x_n)  # Evaluate f once per iteration and reuse it below
+    x_values[k] = x_n
+    f_values[k] = fx_n
+    k += 1
 
     # Check if the solution is close enough
-    if abs(f(x_n)) < tol or abs(b - a) < tol:
+    if abs(fx_n) < tol or abs(b - a) < tol:
         print(f"Root found at x = {x_n:.6f} after {i+1} iterations")
         break
 
     # Update the interval [a, b] based on the sign of f(x_n)
-    if f(x_n) * f(a) < 0:
-        b = x_n  # Root is in [a, x_n]
+    if fx_n * fa < 0:
+        b, fb = x_n, fx_n  # Root is in [a, x_n]
     else:
-        a = x_n  # Root is in [x_n, b]
+        a, fa = x_n, fx_n  # Root is in [x_n, b]
 
 else:
     print(f"Did not converge within {max_iter} iterations")
 
+# Keep only the iterations that were actually performed
+x_values = x_values[:k]
+f_values = f_values[:k]
+
 # Step 6: Create points for plotting the function
 x_plot = np.linspace(0.5, 2.5, 100)  # Range around the root
 y_plot = f(x_plot)
@@ -80,19 +95,22 @@ plt.ylabel('f(x)')
 plt.legend()
 plt.grid(True)
 plt.savefig('regula_falsi_method.png')
-plt.show()
+if not HEADLESS:
+    plt.show()
+plt.close('all')
 
 # Step 8: Print iteration table
 table_data = []
 a_temp = 1.0
 b_temp = 2.0
+fa_temp = f(a_temp)
 for i, (x_n, fx) in enumerate(zip(x_values, f_values)):
     interval_len = abs(b_temp - a_temp)
     table_data.append([i + 1, round(x_n, 8), round(fx, 8), round(interval_len, 8)])
     # Mimic Regula Falsi interval update
-    if f(x_n) * f(a_temp) < 0:
+    if fx * fa_temp < 0:
         b_temp = x_n
     else:
-        a_temp = x_n
+        a_temp, fa_temp = x_n, fx
 headers = ["Iteration", "x_n (Approx. Root)", "f(x_n)", "|b - a|"]
 print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
\ No newline at end of file
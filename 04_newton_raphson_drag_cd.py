@@ -15,11 +15,16 @@
 # https://www.gnu.org/licenses/gpl-3.0.html.
 # -----------------------------------------------------------------------------
 
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 import math
 from tabulate import tabulate
 
+HEADLESS = bool(os.environ.get('HEADLESS'))
+if HEADLESS:
+    plt.switch_backend('Agg')
+
 # Step 1: Define problem parameters
 # a, b: Constants in the equation 1/Cd = a*log(Re*Cd) + b
 # Re: Reynolds number
@@ -33,61 +38,80 @@ Cd0 = 0.1
 tol = 1e-6
 max_iter = 100
 
-# Step 2: Define the function f(Cd) = 1/Cd - a*log(Re*Cd) - b
-def f(Cd):
-    if Cd <= 0:
-        return float('inf')  # Prevent invalid Cd values
-    return (1 / Cd) - a * math.log10(Re * Cd) - b
-
-# Step 3: Define the derivative f'(Cd)
-# f'(Cd) = -1/Cd^2 - a/(Cd * ln(10))
-def f_prime(Cd):
-    if Cd <= 0:
-        return float('inf')  # Prevent invalid Cd values
-    return -1 / (Cd**2) - a / (Cd * math.log(10))
-
-# Step 4: Initialize lists to store iteration history for plotting
-Cd_values = [Cd0]  # Store Cd approximations
-f_values = [f(Cd0)]  # Store f(Cd) values
-
-# Step 5: Newton-Raphson method loop
-Cd_n = Cd0
-for i in range(max_iter):
-    # Compute f(Cd_n) and f'(Cd_n)
-    fx_n = f(Cd_n)
-    fpx_n = f_prime(Cd_n)
-
-    # Check if derivative is zero or very small to avoid division issues
-    if abs(fpx_n) < 1e-10:
-        print("Error: Derivative is too small, method fails!")
-        break
-
-    # Update Cd_n using Newton-Raphson formula
-    Cd_next = Cd_n - fx_n / fpx_n
-
-    # Ensure Cd_next is positive (valid drag coefficient)
-    if Cd_next <= 0:
-        print("Error: Negative or zero Cd encountered!")
-        break
-
-    # Store new values for plotting
-    Cd_values.append(Cd_next)
-    f_values.append(f(Cd_next))
-
-    # Check convergence
-    if abs(f(Cd_next)) < tol or abs(Cd_next - Cd_n) < tol:
-        print(f"Root found at Cd = {Cd_next:.6f} after {i+1} iterations")
-        break
-
-    Cd_n = Cd_next
-else:
-    print(f"Did not converge within {max_iter} iterations")
-
-# Step 6: Create points for plotting the function
+# Constants folded once instead of on every evaluation
+# INV_LN10: 1/ln(10), so that log10(x) = ln(x) * INV_LN10
+# A_OVER_LN10: a/ln(10), the coefficient of 1/Cd in f'(Cd)
+INV_LN10 = 1 / math.log(10)
+A_OVER_LN10 = a * INV_LN10
+
+# Step 2: Define the function f(Cd) = 1/Cd - a*log(Re*Cd) - b together with
+# its derivative f'(Cd) = -1/Cd^2 - a/(Cd * ln(10))
+# Cd must be positive, so the solvers below reject non-positive iterates
+# before evaluating f
+# Both share 1/Cd, so the solvers get f and f' from a single call
+# log: math.log for the scalar solver (plain floats, no NumPy call overhead);
+# pass log=np.log when Cd and Re are NumPy arrays
+def f_and_fprime(Cd, Re=Re, log=math.log):
+    inv_Cd = 1 / Cd
+    log10_ReCd = log(Re * Cd) * INV_LN10
+    fx = inv_Cd - a * log10_ReCd - b
+    fpx = -inv_Cd * inv_Cd - A_OVER_LN10 * inv_Cd
+    return fx, fpx
+
+# Step 3: Define the Newton-Raphson solver
+# Returns the iteration history (Cd_n and f(Cd_n)) for plotting
+def newton_solve(Cd0, tol, max_iter):
+    # Preallocate arrays to store iteration history for plotting
+    # (the initial guess plus at most max_iter updates)
+    Cd_values = np.empty(max_iter + 1)  # Store Cd approximations
+    f_values = np.empty(max_iter + 1)  # Store f(Cd) values
+    # f(Cd_n) and f'(Cd_n), carried over from the previous iteration
+    fx_n, fpx_n = f_and_fprime(Cd0)
+    Cd_values[0] = Cd0
+    f_values[0] = fx_n
+    k = 1  # Number of stored values
+
+    # Newton-Raphson method loop
+    Cd_n = Cd0
+    for i in range(max_iter):
+        # Check if derivative is zero or very small to avoid division issues
+        if abs(fpx_n) < 1e-10:
+            print("Error: Derivative is too small, method fails!")
+            break
+
+        # Update Cd_n using Newton-Raphson formula
+        Cd_next = Cd_n - fx_n / fpx_n
+
+        # Ensure Cd_next is positive (valid drag coefficient)
+        if Cd_next <= 0:
+            print("Error: Negative or zero Cd encountered!")
+            break
+
+        # Store new values for plotting
+        fx_next, fpx_next = f_and_fprime(Cd_next)  # Reused below and in the next iteration
+        Cd_values[k] = Cd_next
+        f_values[k] = fx_next
+        k += 1
+
+        # Check convergence
+        if abs(fx_next) < tol or abs(Cd_next - Cd_n) < tol:
+            print(f"Root found at Cd = {Cd_next:.6f} after {i+1} iterations")
+            break
+
+        Cd_n, fx_n, fpx_n = Cd_next, fx_next, fpx_next
+    else:
+        print(f"Did not converge within {max_iter} iterations")
+
+    return Cd_values[:k], f_values[:k]
+
+# Step 4: Run the Newton-Raphson method
+Cd_values, f_values = newton_solve(Cd0, tol, max_iter)
+
+# Step 5: Create points for plotting the function
 Cd_plot = np.linspace(0.01, 0.2, 100)  # Range around expected Cd
-f_plot = np.array([f(Cd) for Cd in Cd_plot])
+f_plot = f_and_fprime(Cd_plot, log=np.log)[0]  # One vectorized call; the whole grid has Cd > 0
 
-# Step 7: Plot the function and iterations
+# Step 6: Plot the function and iterations
 plt.figure(figsize=(10, 6))
 plt.plot(Cd_plot, f_plot, 'b-', label='f(Cd) = 1/Cd - a*log10(Re*Cd) - b')
 plt.axhline(0, color='black', linestyle='--', linewidth=0.5)  # x-axis
@@ -99,15 +123,53 @@ plt.ylabel('f(Cd)')
 plt.legend()
 plt.grid(True)
 plt.savefig('newton_raphson_drag_coefficient.png')
-plt.show()
+if not HEADLESS:
+    plt.show()
+plt.close('all')
 
-# Step 8: Print iteration table for Drag Coefficient
-table_data = []
-for i, (Cd_i, fCd_i) in enumerate(zip(Cd_values, f_values)):
-    if i == 0:
-        delta = 0.0
-    else:
-        delta = abs(Cd_values[i] - Cd_values[i - 1])
-    table_data.append([i, round(Cd_i, 8), round(fCd_i, 8), round(delta, 8)])
+# Step 7: Print iteration table for Drag Coefficient
+# delta: Change in Cd from the previous iteration (0 for the initial guess)
+delta = np.abs(np.diff(Cd_values, prepend=Cd_values[0]))
+rows = np.column_stack([np.round(Cd_values, 8), np.round(f_values, 8), np.round(delta, 8)]).tolist()
+table_data = [[i] + row for i, row in enumerate(rows)]
 headers = ["Iteration", "Cd (Approx.)", "f(Cd)", "Change in Cd"]
-print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
\ No newline at end of file
+print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
+
+# Step 8: Define a batched Newton-Raphson solver for a sweep of Reynolds numbers
+# Every lane (one per Re) iterates in lockstep on NumPy arrays; a lane stops
+# once it converges or fails (vanishing derivative, non-positive Cd), and the
+# loop ends when no lane is still active
+def newton_batch(Re_values, Cd0, tol, max_iter):
+    Re_values = np.asarray(Re_values, dtype=float)
+    Cd = np.full(Re_values.shape, Cd0)
+    fx, fpx = f_and_fprime(Cd, Re_values, log=np.log)
+    active = np.ones(Re_values.shape, dtype=bool)
+    converged = np.zeros(Re_values.shape, dtype=bool)
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        Cd_n = Cd[active]
+        fpx_n = fpx[active]
+        # Lanes with a vanishing derivative are masked out before dividing,
+        # so they never produce divide-by-zero warnings
+        valid = np.abs(fpx_n) >= 1e-10
+        Cd_next = Cd_n - np.divide(fx[active], fpx_n, out=np.zeros_like(Cd_n), where=valid)
+
+        # Failed lanes keep their last valid Cd and drop out
+        valid &= Cd_next > 0
+        Cd_next = np.where(valid, Cd_next, Cd_n)
+
+        fx[active], fpx[active] = f_and_fprime(Cd_next, Re_values[active], log=np.log)
+        done = valid & ((np.abs(fx[active]) < tol) | (np.abs(Cd_next - Cd_n) < tol))
+        Cd[active] = Cd_next
+        converged[active] = done
+        active[active] = valid & ~done
+    return Cd, converged
+
+# Step 9: Solve for a sweep of Reynolds numbers and print the results
+Re_sweep = np.logspace(3, 6, 7)
+Cd_sweep, converged_sweep = newton_batch(Re_sweep, Cd0, tol, max_iter)
+table_data = []
+for Re_i, Cd_i, ok in zip(Re_sweep, Cd_sweep, converged_sweep):
+    table_data.append([f"{Re_i:.0f}", f"{Cd_i:.6f}", "Yes" if ok else "No"])
+print(tabulate(table_data, headers=["Re", "Cd", "Converged"], tablefmt="fancy_grid"))
\ No newline at end of file
@@ -15,10 +15,15 @@
 # https://www.gnu.org/licenses/gpl-3.0.html.
 # -----------------------------------------------------------------------------
 
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 from tabulate import tabulate
 
+HEADLESS = bool(os.environ.get('HEADLESS'))
+if HEADLESS:
+    plt.switch_backend('Agg')
+
 # Step 1: Define problem parameters
 # P: Pressure (atm)
 # T: Temperature (K)
@@ -37,61 +42,73 @@ V0 = 24.0  # Initial guess based on ideal gas law: V ≈ RT/P
 tol = 1e-6
 max_iter = 100
 
-# Step 2: Define the function f(V) = P*V + a/V - a*b/V^2 - P*b - R*T
-def f(V):
-    if V <= b:
-        return float('inf')  # Prevent invalid V values (V > b)
-    return P * V + a / V - a * b / (V**2) - P * b - R * T
-
-# Step 3: Define the derivative f'(V)
-# f'(V) = P - a/V^2 + 2*a*b/V^3
-def f_prime(V):
-    if V <= b:
-        return float('inf')  # Prevent invalid V values
-    return P - a / (V**2) + 2 * a * b / (V**3)
-
-# Step 4: Initialize lists to store iteration history for plotting
-V_values = [V0]  # Store V approximations
-f_values = [f(V0)]  # Store f(V) values
-
-# Step 5: Newton-Raphson method loop
-V_n = V0
-for i in range(max_iter):
-    # Compute f(V_n) and f'(V_n)
-    fx_n = f(V_n)
-    fpx_n = f_prime(V_n)
-
-    # Check if derivative is too small to avoid division issues
-    if abs(fpx_n) < 1e-10:
-        print("Error: Derivative is too small, method fails!")
-        break
-
-    # Update V_n using Newton-Raphson formula
-    V_next = V_n - fx_n / fpx_n
-
-    # Ensure V_next is physically valid (V > b)
-    if V_next <= b:
-        print("Error: Invalid molar volume encountered (V <= b)!")
-        break
-
-    # Store new values for plotting
-    V_values.append(V_next)
-    f_values.append(f(V_next))
-
-    # Check convergence
-    if abs(f(V_next)) < tol or abs(V_next - V_n) < tol:
-        print(f"Molar volume found at V = {V_next:.6f} L/mol after {i+1} iterations")
-        break
-
-    V_n = V_next
-else:
-    print(f"Did not converge within {max_iter} iterations")
-
-# Step 6: Create points for plotting the function
+# Step 2: Define the function f(V) = P*V + a/V - a*b/V^2 - P*b - R*T together
+# with its derivative f'(V) = P - a/V^2 + 2*a*b/V^3
+# V, P and T may be scalars or NumPy arrays; V must exceed b, so the
+# solvers below reject invalid iterates before evaluating f
+# Both need powers of 1/V, so one division serves f and f' in a single call
+def f_and_fprime(V, P=P, T=T):
+    inv_V = 1 / V
+    inv_V2 = inv_V * inv_V
+    inv_V3 = inv_V2 * inv_V
+    fx = P * V + a * inv_V - a * b * inv_V2 - P * b - R * T
+    fpx = P - a * inv_V2 + 2 * a * b * inv_V3
+    return fx, fpx
+
+# Step 3: Define the Newton-Raphson solver
+# Returns the iteration history (V_n and f(V_n)) for plotting
+def newton_solve(V0, tol, max_iter):
+    # Preallocate arrays to store iteration history for plotting
+    # (the initial guess plus at most max_iter updates)
+    V_values = np.empty(max_iter + 1)  # Store V approximations
+    f_values = np.empty(max_iter + 1)  # Store f(V) values
+    # f(V_n) and f'(V_n), carried over from the previous iteration
+    fx_n, fpx_n = f_and_fprime(V0)
+    V_values[0] = V0
+    f_values[0] = fx_n
+    k = 1  # Number of stored values
+
+    # Newton-Raphson method loop
+    V_n = V0
+    for i in range(max_iter):
+        # Check if derivative is too small to avoid division issues
+        if abs(fpx_n) < 1e-10:
+            print("Error: Derivative is too small, method fails!")
+            break
+
+        # Update V_n using Newton-Raphson formula
+        V_next = V_n - fx_n / fpx_n
+
+        # Ensure V_next is physically valid (V > b)
+        if V_next <= b:
+            print("Error: Invalid molar volume encountered (V <= b)!")
+            break
+
+        # Store new values for plotting
+        fx_next, fpx_next = f_and_fprime(V_next)  # Reused below and in the next iteration
+        V_values[k] = V_next
+        f_values[k] = fx_next
+        k += 1
+
+        # Check convergence
+        if abs(fx_next) < tol or abs(V_next - V_n) < tol:
+            print(f"Molar volume found at V = {V_next:.6f} L/mol after {i+1} iterations")
+            break
+
+        V_n, fx_n, fpx_n = V_next, fx_next, fpx_next
+    else:
+        print(f"Did not converge within {max_iter} iterations")
+
+    return V_values[:k], f_values[:k]
+
+# Step 4: Run the Newton-Raphson method
+V_values, f_values = newton_solve(V0, tol, max_iter)
+
+# Step 5: Create points for plotting the function
 V_plot = np.linspace(max(b + 0.01, 20), 28, 100)  # Range around expected V
-f_plot = np.array([f(V) for V in V_plot])
+f_plot = f_and_fprime(V_plot)[0]  # One vectorized call; the whole grid has V > b
 
-# Step 7: Plot the function and iterations
+# Step 6: Plot the function and iterations
 plt.figure(figsize=(10, 6))
 plt.plot(V_plot, f_plot, 'b-', label='f(V) = P*V + a/V - a*b/V^2 - P*b - RT')
 plt.axhline(0, color='black', linestyle='--', linewidth=0.5)  # x-axis
@@ -103,15 +120,56 @@ plt.ylabel('f(V)')
 plt.legend()
 plt.grid(True)
 plt.savefig('newton_raphson_vander_waals.png')
-plt.show()
+if not HEADLESS:
+    plt.show()
+plt.close('all')
 
-# Step 8: Print iteration table for Van der Waals
-table_data = []
-for i, (V_i, fV_i) in enumerate(zip(V_values, f_values)):
-    if i == 0:
-        delta = 0.0
-    else:
-        delta = abs(V_values[i] - V_values[i - 1])
-    table_data.append([i, round(V_i, 8), round(fV_i, 8), round(delta, 8)])
+# Step 7: Print iteration table for Van der Waals
+# delta: Change in V from the previous iteration (0 for the initial guess)
+delta = np.abs(np.diff(V_values, prepend=V_values[0]))
+rows = np.column_stack([np.round(V_values, 8), np.round(f_values, 8), np.round(delta, 8)]).tolist()
+table_data = [[i] + row for i, row in enumerate(rows)]
 headers = ["Iteration", "V (Approx.)", "f(V)", "Change in V"]
-print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
\ No newline at end of file
+print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
+
+# Step 8: Define a batched Newton-Raphson solver for a sweep of (P, T) pairs
+# Every lane (one per pair) iterates in lockstep on NumPy arrays, starting
+# from its ideal-gas volume RT/P; a lane stops once it converges or fails
+# (vanishing derivative, V <= b), and the loop ends when no lane is active
+def newton_batch(P_values, T_values, tol, max_iter):
+    P_values, T_values = np.broadcast_arrays(np.asarray(P_values, dtype=float),
+                                             np.asarray(T_values, dtype=float))
+    V = R * T_values / P_values
+    fx, fpx = f_and_fprime(V, P_values, T_values)
+    active = np.ones(V.shape, dtype=bool)
+    converged = np.zeros(V.shape, dtype=bool)
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        V_n = V[active]
+        fpx_n = fpx[active]
+        # Lanes with a vanishing derivative are masked out before dividing,
+        # so they never produce divide-by-zero warnings
+        valid = np.abs(fpx_n) >= 1e-10
+        V_next = V_n - np.divide(fx[active], fpx_n, out=np.zeros_like(V_n), where=valid)
+
+        # Failed lanes keep their last valid V and drop out
+        valid &= V_next > b
+        V_next = np.where(valid, V_next, V_n)
+
+        fx[active], fpx[active] = f_and_fprime(V_next, P_values[active], T_values[active])
+        done = valid & ((np.abs(fx[active]) < tol) | (np.abs(V_next - V_n) < tol))
+        V[active] = V_next
+        converged[active] = done
+        active[active] = valid & ~done
+    return V, converged
+
+# Step 9: Solve for a grid of pressures and temperatures and print the results
+P_grid, T_grid = np.meshgrid([1.0, 10.0, 50.0, 100.0], [250.0, 300.0, 350.0])
+V_sweep, converged_sweep = newton_batch(P_grid, T_grid, tol, max_iter)
+table_data = []
+for P_i, T_i, V_i, ok in zip(P_grid.ravel(), T_grid.ravel(),
+                             V_sweep.ravel(), converged_sweep.ravel()):
+    table_data.append([f"{P_i:.1f}", f"{T_i:.1f}", f"{V_i:.6f}", "Yes" if ok else "No"])
+print(tabulate(table_data, headers=["P (atm)", "T (K)", "V (L/mol)", "Converged"],
+               tablefmt="fancy_grid"))
\ No newline at end of file
@@ -15,11 +15,15 @@
 # https://www.gnu.org/licenses/gpl-3.0.html.
 # -----------------------------------------------------------------------------
 
+import os
 import numpy as np
 import matplotlib.pyplot as plt
-import math
 from tabulate import tabulate
 
+HEADLESS = bool(os.environ.get('HEADLESS'))
+if HEADLESS:
+    plt.switch_backend('Agg')
+
 # Step 1: Define problem parameters
 # T: Total time (0 to 1)
 # Nt: Number of time steps
@@ -54,9 +58,7 @@ for n in range(Nt):
 # Step 7: Compute analytical solution for comparison
 # For du/dt = -2u + t, u(0) = 1, the analytical solution is:
 # u(t) = (1/4)t - (1/8) + (9/8)e^(-2t)
-u_analytical = np.zeros(Nt + 1)
-for i in range(Nt + 1):
-    u_analytical[i] = (1/4) * t[i] - (1/8) + (9/8) * math.exp(-2 * t[i])
+u_analytical = (1/4) * t - (1/8) + (9/8) * np.exp(-2 * t)
 
 # Step 8: Plot the numerical and analytical solutions
 plt.figure(figsize=(10, 6))
@@ -68,7 +70,9 @@ plt.ylabel('u(t)')
 plt.legend()
 plt.grid(True)
 plt.savefig('ivp_euler_method.png')
-plt.show()
+if not HEADLESS:
+    plt.show()
+plt.close('all')
 
 # Step 9: Print table with tabulate
 indices = range(0, Nt + 1, 10)
@@ -15,11 +15,15 @@
 # https://www.gnu.org/licenses/gpl-3.0.html.
 # -----------------------------------------------------------------------------
 
+import os
 import numpy as np
 import matplotlib.pyplot as plt
-import math
 from tabulate import tabulate
 
+HEADLESS = bool(os.environ.get('HEADLESS'))
+if HEADLESS:
+    plt.switch_backend('Agg')
+
 # Step 1: Define problem parameters
 # T: Total time (0 to 1)
 # Nt: Number of time steps
@@ -36,36 +40,31 @@ dt = T / Nt
 # t: Array of time points from 0 to T
 t = np.linspace(0, T, Nt + 1)
 
-# Step 4: Define the ODE function
-# f(t, u) = -2u + t (the derivative du/dt)
-def f(t, u):
-    return -2.0 * u + t
-
-# Step 5: Initialize solution array
+# Step 4: Initialize solution array
 # u: Array to store solution at each time step
 u = np.zeros(Nt + 1)
 u[0] = u0  # Set initial condition
 
-# Step 6: Modified Euler method time-stepping loop
+# Step 5: Modified Euler method time-stepping loop
 # Update: u[n+1] = u[n] + (dt/2) * [f(t[n], u[n]) + f(t[n+1], u[n] + dt * f(t[n], u[n]))]
+# where f(t, u) = -2u + t (the derivative du/dt) is written out inline
+half_dt = dt / 2  # Loop invariant, computed once
 for n in range(Nt):
     # Compute slope at current point
-    k1 = f(t[n], u[n])
+    k1 = -2.0 * u[n] + t[n]
     # Predict u at next point using Euler step
     u_predict = u[n] + dt * k1
     # Compute slope at predicted point
-    k2 = f(t[n + 1], u_predict)
+    k2 = -2.0 * u_predict + t[n + 1]
     # Update using average of slopes
-    u[n + 1] = u[n] + (dt / 2) * (k1 + k2)
+    u[n + 1] = u[n] + half_dt * (k1 + k2)
 
-# Step 7: Compute analytical solution for comparison
+# Step 6: Compute analytical solution for comparison
 # For du/dt = -2u + t, u(0) = 1, the analytical solution is:
 # u(t) = (1/4)t - (1/8) + (9/8)e^(-2t)
-u_analytical = np.zeros(Nt + 1)
-for i in range(Nt + 1):
-    u_analytical[i] = (1/4) * t[i] - (1/8) + (9/8) * math.exp(-2 * t[i])
+u_analytical = (1/4) * t - (1/8) + (9/8) * np.exp(-2 * t)
 
-# Step 8: Plot the numerical and analytical solutions
+# Step 7: Plot the numerical and analytical solutions
 plt.figure(figsize=(10, 6))
 plt.plot(t, u, 'b-', label='Numerical Solution (Modified Euler Method)')
 plt.plot(t, u_analytical, 'r--', label='Analytical Solution')
@@ -75,9 +74,11 @@ plt.ylabel('u(t)')
 plt.legend()
 plt.grid(True)
 plt.savefig('ivp_modified_euler_method.png')
-plt.show()
+if not HEADLESS:
+    plt.show()
+plt.close('all')
 
-# Step 9: Print table with tabulate
+# Step 8: Print table with tabulate
 indices = range(0, Nt + 1, 10)
 table_data = []
 for i in indices:
@@ -15,17 +15,16 @@
 # https://www.gnu.org/licenses/gpl-3.0.html.
 # -----------------------------------------------------------------------------
 
+import os
 import numpy as np
 import matplotlib.pyplot as plt
-import math
 from tabulate import tabulate
 
-# Step 1: Define the ODE function
-# f(t, u) = -2u + t (the derivative du/dt)
-def f(t, u):
-    return -2.0 * u + t
+HEADLESS = bool(os.environ.get('HEADLESS'))
+if HEADLESS:
+    plt.switch_backend('Agg')
 
-# Step 2: Define problem parameters
+# Step 1: Define problem parameters
 # T: Total time (0 to 1)
 # Nt: Number of time steps
 # u0: Initial condition u(0) = 1
@@ -33,41 +32,47 @@ T = 1.0
 Nt = 100
 u0 = 1.0
 
-# Step 3: Calculate time step size
+# Step 2: Calculate time step size
 # dt: Time step size
 dt = T / Nt
 
-# Step 4: Create time grid
+# Step 3: Create time grid
 # t: Array of time points from 0 to T
 t = np.linspace(0, T, Nt + 1)
 
-# Step 5: Initialize solution array
-# u: Array to store solution at each time step
-u = np.zeros(Nt + 1)
-u[0] = u0  # Set initial condition
-
-# Step 6: RK4 method time-stepping loop
+# Step 4: Define the RK4 integrator
 # Update: u[n+1] = u[n] + (dt/6) * (k1 + 2*k2 + 2*k3 + k4)
-for n in range(Nt):
-    # Compute k1 = f(t_n, u_n)
-    k1 = f(t[n], u[n])
-    # Compute k2 = f(t_n + dt/2, u_n + (dt/2)*k1)
-    k2 = f(t[n] + dt/2, u[n] + (dt/2) * k1)
-    # Compute k3 = f(t_n + dt/2, u_n + (dt/2)*k2)
-    k3 = f(t[n] + dt/2, u[n] + (dt/2) * k2)
-    # Compute k4 = f(t_n + dt, u_n + dt*k3)
-    k4 = f(t[n] + dt, u[n] + dt * k3)
-    # Update u[n+1]
-    u[n + 1] = u[n] + (dt/6) * (k1 + 2*k2 + 2*k3 + k4)
+# where f(t, u) = -2u + t (the derivative du/dt) is written out inline
+# The running value u_n is kept as a plain float between steps, and the
+# array u is only written once per step
+def rk4_integrate(t, dt, u0):
+    # u: Array to store solution at each time step
+    u = np.zeros(len(t))
+    u[0] = u0  # Set initial condition
+    u_n = u0
+    for n, t_n in enumerate(t[:-1].tolist()):
+        # Compute k1 = f(t_n, u_n)
+        k1 = -2.0 * u_n + t_n
+        # Compute k2 = f(t_n + dt/2, u_n + (dt/2)*k1)
+        k2 = -2.0 * (u_n + (dt/2) * k1) + (t_n + dt/2)
+        # Compute k3 = f(t_n + dt/2, u_n + (dt/2)*k2)
+        k3 = -2.0 * (u_n + (dt/2) * k2) + (t_n + dt/2)
+        # Compute k4 = f(t_n + dt, u_n + dt*k3)
+        k4 = -2.0 * (u_n + dt * k3) + (t_n + dt)
+        # Update u[n+1]
+        u_n = u_n + (dt/6) * (k1 + 2*k2 + 2*k3 + k4)
+        u[n + 1] = u_n
+    return u
+
+# Step 5: RK4 method time-stepping
+u = rk4_integrate(t, dt, u0)
 
-# Step 7: Compute analytical solution for comparison
+# Step 6: Compute analytical solution for comparison
 # For du/dt = -2u + t, u(0) = 1, the analytical solution is:
 # u(t) = (1/4)t - (1/8) + (9/8)e^(-2t)
-u_analytical = np.zeros(Nt + 1)
-for i in range(Nt + 1):
-    u_analytical[i] = (1/4) * t[i] - (1/8) + (9/8) * math.exp(-2 * t[i])
+u_analytical = (1/4) * t - (1/8) + (9/8) * np.exp(-2 * t)
 
-# Step 8: Plot the numerical and analytical solutions
+# Step 7: Plot the numerical and analytical solutions
 plt.figure(figsize=(10, 6))
 plt.plot(t, u, 'b-', label='Numerical Solution (RK4 Method)')
 plt.plot(t, u_analytical, 'r--', label='Analytical Solution')
@@ -77,9 +82,11 @@ plt.ylabel('u(t)')
 plt.legend()
 plt.grid(True)
 plt.savefig('rk4_method.png')
-plt.show()
+if not HEADLESS:
+    plt.show()
+plt.close('all')
 
-# Step 9: Print table with tabulate
+# Step 8: Print table with tabulate
 indices = range(0, Nt + 1, 10)
 table_data = []
 for i in indices:
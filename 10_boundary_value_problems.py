@@ -15,10 +15,15 @@
 # https://www.gnu.org/licenses/gpl-3.0.html.
 # -----------------------------------------------------------------------------
 
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 from tabulate import tabulate
 
+HEADLESS = bool(os.environ.get('HEADLESS'))
+if HEADLESS:
+    plt.switch_backend('Agg')
+
 # Step 1: Define the function and its derivative
 # f(x) = x^3 - x - 2
 def f(x):
@@ -36,37 +41,51 @@ x0 = 1.5
 tol = 1e-6
 max_iter = 100
 
-# Step 3: Initialize lists to store iteration history for plotting
-x_values = [x0]  # Store x approximations
-f_values = [f(x0)]  # Store f(x) values
+# Step 3: Define the Newton-Raphson solver
+# Returns the iteration history (x_n and f(x_n)) for plotting
+def newton_solve(x0, tol, max_iter):
+    # Preallocate arrays to store iteration history for plotting
+    # (the initial guess plus at most max_iter updates)
+    x_values = np.empty(max_iter + 1)  # Store x approximations
+    f_values = np.empty(max_iter + 1)  # Store f(x) values
+    x_values[0] = x0
+    f_values[0] = f(x0)
+    k = 1  # Number of stored values
+
+    # Newton-Raphson method loop
+    x_n = x0
+    fx_n = f_values[0]  # f(x_n), carried over from the previous iteration
+    for i in range(max_iter):
+        # Compute f'(x_n)
+        fpx_n = f_prime(x_n)
+
+        # Check if derivative is zero to avoid division by zero
+        if abs(fpx_n) < 1e-10:
+            print("Error: Derivative is zero, method fails!")
+            break
 
-# Step 4: Newton-Raphson method loop
-x_n = x0
-for i in range(max_iter):
-    # Compute f(x_n) and f'(x_n)
-    fx_n = f(x_n)
-    fpx_n = f_prime(x_n)
+        # Update x_n using Newton-Raphson formula
+        x_next = x_n - fx_n / fpx_n
 
-    # Check if derivative is zero to avoid division by zero
-    if abs(fpx_n) < 1e-10:
-        print("Error: Derivative is zero, method fails!")
-        break
+        # Store new values for plotting
+        fx_next = f(x_next)  # Evaluate f once and reuse it below
+        x_values[k] = x_next
+        f_values[k] = fx_next
+        k += 1
 
-    # Update x_n using Newton-Raphson formula
-    x_next = x_n - fx_n / fpx_n
+        # Check convergence
+        if abs(fx_next) < tol or abs(x_next - x_n) < tol:
+            print(f"Root found at x = {x_next:.6f} after {i+1} iterations")
+            break
 
-    # Store new values for plotting
-    x_values.append(x_next)
-    f_values.append(f(x_next))
+        x_n, fx_n = x_next, fx_next
+    else:
+        print(f"Did not converge within {max_iter} iterations")
 
-    # Check convergence
-    if abs(f(x_next)) < tol or abs(x_next - x_n) < tol:
-        print(f"Root found at x = {x_next:.6f} after {i+1} iterations")
-        break
+    return x_values[:k], f_values[:k]
 
-    x_n = x_next
-else:
-    print(f"Did not converge within {max_iter} iterations")
+# Step 4: Run the Newton-Raphson method
+x_values, f_values = newton_solve(x0, tol, max_iter)
 
 # Step 5: Create points for plotting the function
 x_plot = np.linspace(0.5, 2.5, 100)  # Range around the root
@@ -84,7 +103,9 @@ plt.ylabel('f(x)')
 plt.legend()
 plt.grid(True)
 plt.savefig('newton_raphson_method.png')
-plt.show()
+if not HEADLESS:
+    plt.show()
+plt.close('all')
 
 # Step 7: Print table with tabulate
 table_data = []
@@ -1,42 +1,116 @@
-# Step 1: Initialize the ATM system
-# Define a function to handle the ATM operations
+import sys
+
+# Step 1: Define the messages shown to the user
+# Each message is defined once and shared by the interactive and batch sessions
+WELCOME = "Welcome to the Basic ATM System"
+INVALID_BALANCE = "Error: Please enter a valid number for the balance!"
+INVALID_WITHDRAWAL = "Error: Please enter a valid number for the withdrawal amount!"
+NEGATIVE_BALANCE = "Error: Initial balance cannot be negative!"
+NEGATIVE_WITHDRAWAL = "Error: Withdrawal amount cannot be negative!"
+INSUFFICIENT_BALANCE = "Error: Insufficient balance!"
+
+# Step 2: Define the ATM transaction logic
+# check_balance: return the error message for an invalid initial balance, or None
+def check_balance(initial_balance):
+    if initial_balance < 0:
+        return NEGATIVE_BALANCE
+    return None
+
+# process: check one withdrawal against an initial balance without any I/O
+# Returns (ok, balance, message): ok is True if the withdrawal succeeded,
+# balance is the balance afterwards and message is the text to show the user
+def process(initial_balance, withdraw_amount):
+    # Check if initial balance is non-negative
+    error = check_balance(initial_balance)
+    if error:
+        return False, initial_balance, error
+
+    # Set current balance
+    balance = initial_balance
+
+    # Check if withdrawal amount is non-negative
+    if withdraw_amount < 0:
+        return False, balance, NEGATIVE_WITHDRAWAL
+
+    # Check if withdrawal is possible
+    if withdraw_amount > balance:
+        return False, balance, (f"{INSUFFICIENT_BALANCE}\n"
+                                f"Current balance: {balance:.2f}")
+
+    # Update balance and build the result message
+    balance -= withdraw_amount
+    return True, balance, (f"Withdrawal successful! Amount withdrawn: {withdraw_amount:.2f}\n"
+                           f"New balance: {balance:.2f}")
+
+# Step 3: Define the interactive ATM session
+# Prompts for one transaction and prints the result
 def atm_system():
-    # Step 2: Prompt user to specify initial balance
+    # Prompt user to specify initial balance
     try:
         initial_balance = float(input("Enter initial balance: "))
-        # Check if initial balance is non-negative
-        if initial_balance < 0:
-            print("Error: Initial balance cannot be negative!")
-            return
     except ValueError:
-        print("Error: Please enter a valid number for the balance!")
+        print(INVALID_BALANCE)
         return
-    
-    # Step 3: Set current balance
-    balance = initial_balance
-    
-    # Step 4: Prompt user to specify withdrawal amount
+    # An invalid balance ends the session before the withdrawal prompt on
+    # purpose, so the user is not asked for an amount that cannot be processed
+    error = check_balance(initial_balance)
+    if error:
+        print(error)
+        return
+
+    # Prompt user to specify withdrawal amount
     try:
         withdraw_amount = float(input("Enter amount to withdraw: "))
-        # Check if withdrawal amount is non-negative
-        if withdraw_amount < 0:
-            print("Error: Withdrawal amount cannot be negative!")
-            return
     except ValueError:
-        print("Error: Please enter a valid number for the withdrawal amount!")
+        print(INVALID_WITHDRAWAL)
         return
-    
-    # Step 5: Check if withdrawal is possible
-    if withdraw_amount > balance:
-        print("Error: Insufficient balance!")
-        print(f"Current balance: {balance:.2f}")
-    else:
-        # Step 6: Update balance and display result
-        balance -= withdraw_amount
-        print(f"Withdrawal successful! Amount withdrawn: {withdraw_amount:.2f}")
-        print(f"New balance: {balance:.2f}")
 
-# Step 7: Run the ATM system
+    # Process the withdrawal and display result
+    _, _, message = process(initial_balance, withdraw_amount)
+    print(message)
+
+# Step 4: Define the batch ATM session
+# Reads whitespace-separated pairs "initial_balance withdraw_amount", one
+# transaction per pair, and returns all results as a single string
+# Each transaction gives one line, prefixed with its input pair:
+# "<initial_balance> <withdraw_amount>: <message>"
+def atm_batch(text):
+    tokens = text.split()
+    outputs = []
+    for k in range(0, len(tokens), 2):
+        pair = " ".join(tokens[k:k + 2])
+        try:
+            initial_balance = float(tokens[k])
+        except ValueError:
+            outputs.append(f"{pair}: {INVALID_BALANCE}")
+            continue
+        try:
+            withdraw_amount = float(tokens[k + 1])
+        except (ValueError, IndexError):
+            outputs.append(f"{pair}: {INVALID_WITHDRAWAL}")
+            continue
+        _, _, message = process(initial_balance, withdraw_amount)
+        # Multi-line messages are joined so each transaction stays on one line
+        outputs.append(f"{pair}: " + "; ".join(message.splitlines()))
+    return "\n".join(outputs)
+
+# Step 5: Run the ATM system
+# By default the session is interactive
+# With --batch (for scripts and tests) the transactions are read at once from
+# the file given after it, or from stdin, and the results are written in one go:
+#   python 15_atm_system.py --batch transactions.txt
 if __name__ == "__main__":
-    print("Welcome to the Basic ATM System")
-    atm_system()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        if len(sys.argv) > 2:
+            with open(sys.argv[2], encoding="utf-8") as batch_file:
+                text = batch_file.read()
+        else:
+            text = sys.stdin.read()
+        outputs = [WELCOME]
+        results = atm_batch(text)
+        if results:
+            outputs.append(results)
+        sys.stdout.write("\n".join(outputs) + "\n")
+    else:
+        print(WELCOME)
+        atm_system()